@@ -13,13 +13,15 @@ SIDE_RIGHT_IMG = os.path.join(ASSETS_IMAGES, "bg_side_right.png")
 
 class ParallaxLayer:
     """Uma camada que pode ser uma imagem (tiled) ou um gerador procedural fallback."""
-    def __init__(self, screen_size, image_path=None, speed=(0.0, 0.0), tile_vertical=True, horizontal_wrap=False):
+    def __init__(self, screen_size, image_path=None, speed=(0.0, 0.0), tile_vertical=True, horizontal_wrap=False,
+                 opaque=False):
         """
         screen_size: (w,h)
         image_path: caminho (opcional). Se None ou não existir, usa fallback procedural.
         speed: (vx, vy) em px/s — movimento da camada (positivo vy = move para baixo)
         tile_vertical: se True, usa tiling vertical (coloca 2 cópias e faz loop)
         horizontal_wrap: se True, permite movimento horizontal contínuo com wrap
+        opaque: se True, a imagem é convertida sem canal alpha (camada de fundo que cobre tudo)
         """
         self.screen_w, self.screen_h = screen_size
         self.image_path = image_path
@@ -33,12 +35,25 @@ class ParallaxLayer:
         self.image = None
         if image_path and os.path.isfile(image_path):
             try:
-                img = pygame.image.load(image_path).convert_alpha()
+                img = pygame.image.load(image_path)
+                # camada opaca vira cópia do formato do display: blit direto, sem mistura por pixel
+                img = img.convert() if opaque else img.convert_alpha()
                 # não redimensionamos aqui: a camada lida com tiling/scale no draw
                 self.image = img
             except Exception:
                 self.image = None
 
+        # versão já escalada para desenho, calculada uma vez (evita smoothscale a cada frame)
+        self._draw_image = None
+        if self.image:
+            iw, ih = self.image.get_size()
+            # se imagem menor que tela width, vamos esticar na largura (mantemos aspecto)
+            if 0 < iw < self.screen_w:
+                x_scale = self.screen_w / iw
+                self._draw_image = pygame.transform.smoothscale(self.image, (int(iw * x_scale), ih))
+            else:
+                self._draw_image = self.image
+
     def update(self, dt):
         # atualiza offset com base na velocidade (px/s)
         self.offset.x += self.speed.x * dt
@@ -60,22 +75,12 @@ class ParallaxLayer:
     def draw(self, surface):
         """Desenha a camada sobre a surface (deve cobrir toda a tela)."""
         if self.image:
-            iw, ih = self.image.get_size()
-            # escala horizontal para largura da tela se imagem de fundo for estreita (opcional)
+            ih = self.image.get_height()
             # desenhamos cópias tiling para cobrir a tela verticalmente/horizontalmente
             # calculamos o primeiro y a desenhar
             start_y = - (self.offset.y % ih)
-            x_scale = 1.0
-            # se imagem menor que tela width, vamos esticar na largura (mantemos aspecto)
-            if iw < self.screen_w:
-                x_scale = self.screen_w / iw
-            # cria versão escalada se necessário
-            if x_scale != 1.0:
-                img_draw = pygame.transform.smoothscale(self.image, (int(iw * x_scale), ih))
-                iw_draw, ih_draw = img_draw.get_size()
-            else:
-                img_draw = self.image
-                iw_draw, ih_draw = iw, ih
+            img_draw = self._draw_image
+            iw_draw, ih_draw = img_draw.get_size()
 
             # horizontal tiling - vamos cobrir toda largura
             x = 0
@@ -132,7 +137,8 @@ class ParallaxBackground:
         # water: velocidade vertical (move para baixo)
         # Ajuste water_speed para sensacao de velocidade
         self.water_layer = ParallaxLayer(screen_size, image_path=water_image_path,
-                                         speed=(0.0, water_speed), tile_vertical=True, horizontal_wrap=False)
+                                         speed=(0.0, water_speed), tile_vertical=True, horizontal_wrap=False,
+                                         opaque=True)
 
         # sides: deslocamento vertical mais lento, podem usar imagens verticais
         # colocamos duas camadas para as laterais (left / right)
@@ -148,6 +154,15 @@ class ParallaxBackground:
         self._fallback_water_color = (10, 70, 150)
         self._fallback_side_color = (90, 110, 70)
 
+        # áreas laterais como subsurfaces da surface de destino: as camadas desenham direto nela
+        # (sem surface intermediária para limpar e compor com alpha a cada frame)
+        side_w = int(w * self.side_width_frac)
+        self._left_area = pygame.Rect(0, 0, side_w, h)
+        self._right_area = pygame.Rect(w - side_w, 0, side_w, h)
+        self._target = None
+        self._left_view = None
+        self._right_view = None
+
     def update(self, dt):
         # atualizamos todas as camadas sempre (independente do movimento do player)
         self.water_layer.update(dt)
@@ -164,17 +179,11 @@ class ParallaxBackground:
             surface.fill(self._fallback_water_color)
             self.water_layer.draw(surface)
 
-        # desenha as laterais (com imagens ou fallback) por cima da água
-        sw, sh = self.screen_size
-        side_w = int(sw * self.side_width_frac)
-
-        # left: produz uma surface auxiliar só com a área lateral e manda layer desenhar nela
-        left_surf = pygame.Surface((side_w, sh), pygame.SRCALPHA)
-        # se layer tiver imagem, seu draw cobrirá a left_surf verticalmente; se não, draw fallback desenha faixas
-        self.left_layer.draw(left_surf)
-        surface.blit(left_surf, (0, 0))
-
-        # right:
-        right_surf = pygame.Surface((side_w, sh), pygame.SRCALPHA)
-        self.right_layer.draw(right_surf)
-        surface.blit(right_surf, (sw - side_w, 0))
\ No newline at end of file
+        # desenha as laterais (com imagens ou fallback) por cima da água, cada uma na sua
+        # subsurface: coordenadas locais da área lateral e recorte automático na largura dela
+        if surface is not self._target:
+            self._target = surface
+            self._left_view = surface.subsurface(self._left_area)
+            self._right_view = surface.subsurface(self._right_area)
+        self.left_layer.draw(self._left_view)
+        self.right_layer.draw(self._right_view)
\ No newline at end of file
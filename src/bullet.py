@@ -8,37 +8,56 @@
 import os
 import pygame
 
+from src.utils import PooledSprite
+
 ASSETS_IMAGES = os.path.join(os.path.dirname(__file__), "..", "assets", "images")
 BULLET_IMAGE_PATH = os.path.join(ASSETS_IMAGES, "bullet.png")
 
 SCREEN_WIDTH = 480
 SCREEN_HEIGHT = 800
 
-class Bullet(pygame.sprite.Sprite):
+# owner -> Surface da bala; evita pygame.image.load + smoothscale a cada tiro
+_image_cache = {}
+
+
+def _get_bullet_image(owner):
+    """Carrega imagem da bala se houver; senão gera placeholder (cacheado por owner)."""
+    img = _image_cache.get(owner)
+    if img is not None:
+        return img
+    if os.path.isfile(BULLET_IMAGE_PATH):
+        img = pygame.image.load(BULLET_IMAGE_PATH).convert_alpha()
+        # escala automática para tamanho razoável
+        img = pygame.transform.smoothscale(img, (8, 16))
+    else:
+        # Placeholder retangular (8x16), totalmente opaco: convert() sem canal alpha
+        img = pygame.Surface((8, 16)).convert()
+        if owner == "player":
+            img.fill((255, 220, 60))
+        else:
+            img.fill((220, 80, 80))
+    _image_cache[owner] = img
+    return img
+
+
+class Bullet(PooledSprite):
     def __init__(self, pos=(240, 700), vx=0.0, vy=-500.0, owner="player"):
         """
         pos: tupla (x, y) posição inicial da bala (center)
         vx, vy: velocidade em px/s (float). Por exemplo vy = -600 faz bala subir.
         owner: 'player' ou 'enemy' (usado para lógica de colisão)
+        Prefira Bullet.acquire(...) (mesmos argumentos) para reaproveitar balas mortas.
         """
         super().__init__()
+        self.reset(pos, vx, vy, owner)
+
+    def reset(self, pos=(240, 700), vx=0.0, vy=-500.0, owner="player"):
         self.vx = float(vx)
         self.vy = float(vy)
         self.owner = owner
 
-        # Carrega imagem da bala se houver; senão gera placeholder amarelo
-        if os.path.isfile(BULLET_IMAGE_PATH):
-            img = pygame.image.load(BULLET_IMAGE_PATH).convert_alpha()
-            # escala automática para tamanho razoável
-            self.image = pygame.transform.smoothscale(img, (8, 16))
-        else:
-            # Placeholder retangular (8x16)
-            surf = pygame.Surface((8, 16), pygame.SRCALPHA)
-            if owner == "player":
-                pygame.draw.rect(surf, (255, 220, 60), (0, 0, 8, 16))
-            else:
-                pygame.draw.rect(surf, (220, 80, 80), (0, 0, 8, 16))
-            self.image = surf
+        # Imagem compartilhada entre as balas (carregada do disco só na primeira vez)
+        self.image = _get_bullet_image(owner)
 
         # Rect centralizado na posição inicial
         self.rect = self.image.get_rect(center=pos)
@@ -6,6 +6,8 @@ import math
 import random
 import pygame
 
+from src.utils import PooledSprite
+
 # ---------------- paths ----------------
 BASE_DIR = os.path.dirname(__file__)
 ASSETS_IMAGES = os.path.normpath(os.path.join(BASE_DIR, "..", "assets", "images"))
@@ -32,8 +34,20 @@ FAST_IMG = os.path.join(ASSETS_IMAGES, EXPECTED_IMAGES["fast"])
 
 SCREEN_WIDTH = 480
 SCREEN_HEIGHT = 800
+# inimigo que desce além desta linha (topo do rect) se remove sozinho no update
+DESPAWN_Y = SCREEN_HEIGHT + 120
+
+# identificador de tipo de cada inimigo (atributo de classe "kind"): comparação de int
+# nos laços do jogo em vez de isinstance
+KIND_BASIC = 0
+KIND_ZIGZAG = 1
+KIND_FAST = 2
+KIND_SHOOTER = 3
+KIND_BOSS = 4
 
 _missing_warned = set()
+# (path, size, fallback_color) -> Surface já carregada/escalada; compartilhada entre instâncias
+_image_cache = {}
 
 
 def _try_variants(filename):
@@ -82,7 +96,18 @@ def load_image_safe(path, size=None, fallback_color=(180, 60, 60)):
     Carrega a imagem tentando várias alternativas.
     - path pode ser um caminho completo ou somente o nome do arquivo esperado.
     - se não encontrar nada, retorna um fallback contendo o nome do arquivo como texto (útil para debug).
+    O resultado é cacheado: chamadas seguintes com os mesmos argumentos devolvem a mesma Surface
+    (não modifique a surface retornada; faça .copy() se precisar alterá-la).
     """
+    key = (path, size, fallback_color)
+    cached = _image_cache.get(key)
+    if cached is None:
+        cached = _load_image_uncached(path, size, fallback_color)
+        _image_cache[key] = cached
+    return cached
+
+
+def _load_image_uncached(path, size, fallback_color):
     tried = []
     for candidate in _try_variants(path):
         tried.append(candidate)
@@ -127,61 +152,77 @@ def load_image_safe(path, size=None, fallback_color=(180, 60, 60)):
     except Exception:
         pass
 
-    return surf
+    return surf.convert_alpha()
 
 
 # ---------------- Enemy projectiles ----------------
-class EnemyBullet(pygame.sprite.Sprite):
+class EnemyBullet(PooledSprite):
     """Projétil simples usado por inimigos (shooter enemies)."""
+    # margem fora da tela antes de destruir a bala (px)
+    margin_x = 60
+    margin_y = 50
+
     def __init__(self, pos, vx, vy, speed=200, image_path=ENEMY_BULLET_IMG):
         super().__init__()
-        self.image = load_image_safe(image_path, (14, 14), (240, 120, 60))
+        self.image = self._load_image(image_path)
+        self.reset(pos, vx, vy, speed=speed)
+
+    def reset(self, pos, vx, vy, speed=200):
         self.rect = self.image.get_rect(center=pos)
+        # posição em float: com int(vx * dt) balas lentas nunca andavam
+        self.pos = pygame.math.Vector2(self.rect.center)
         self.vx = vx
         self.vy = vy
         self.speed = speed
 
+    def _load_image(self, image_path):
+        return load_image_safe(image_path, (14, 14), (240, 120, 60))
+
     def update(self, dt):
-        self.rect.x += int(self.vx * dt)
-        self.rect.y += int(self.vy * dt)
-        if (self.rect.top > SCREEN_HEIGHT + 50 or
-                self.rect.bottom < -50 or
-                self.rect.right < -60 or
-                self.rect.left > SCREEN_WIDTH + 60):
+        self.pos.x += self.vx * dt
+        self.pos.y += self.vy * dt
+        self.rect.center = (int(self.pos.x), int(self.pos.y))
+        if (self.rect.top > SCREEN_HEIGHT + self.margin_y or
+                self.rect.bottom < -self.margin_y or
+                self.rect.right < -self.margin_x or
+                self.rect.left > SCREEN_WIDTH + self.margin_x):
             self.kill()
 
 
-class BossBullet(pygame.sprite.Sprite):
+class BossBullet(EnemyBullet):
     """Projétil do boss com imagem própria."""
+    margin_y = 60
+
     def __init__(self, pos, vx, vy, speed=280, image_path=BOSS_BULLET_IMG):
-        super().__init__()
-        self.image = load_image_safe(image_path, (20, 20), (255, 90, 90))
-        self.rect = self.image.get_rect(center=pos)
-        self.vx = vx
-        self.vy = vy
-        self.speed = speed
+        super().__init__(pos, vx, vy, speed=speed, image_path=image_path)
 
-    def update(self, dt):
-        self.rect.x += int(self.vx * dt)
-        self.rect.y += int(self.vy * dt)
-        if (self.rect.top > SCREEN_HEIGHT + 60 or
-                self.rect.bottom < -60 or
-                self.rect.right < -60 or
-                self.rect.left > SCREEN_WIDTH + 60):
-            self.kill()
+    def _load_image(self, image_path):
+        return load_image_safe(image_path, (20, 20), (255, 90, 90))
 
 
 # ---------------- Base Enemy ----------------
-class Enemy(pygame.sprite.Sprite):
+class Enemy(PooledSprite):
+    """
+    Base dos inimigos. Atributos fixos ficam no __init__; o estado de movimento/vida
+    fica em reset(pos, player_ref), que o pool chama ao reaproveitar um inimigo morto
+    (use Classe.acquire(pos=..., player_ref=...) para spawnar).
+    """
+    kind = KIND_BASIC
+    # True nos inimigos que produzem tiros em self.new_bullets (o Game os recolhe a cada frame)
+    shoots = False
+
     def __init__(self, pos=(240, -50), hp=1, image=None, size=(48, 48), player_ref=None):
         super().__init__()
-        self.hp = hp
         self.max_hp = hp
-        self.player_ref = player_ref
-        self.pos = pygame.math.Vector2(pos)
         self.size = size
         self.original_image = image if image is not None else load_image_safe(ENEMY_IMG, size)
         self.image = self.original_image.copy()
+        self.reset(pos, player_ref)
+
+    def reset(self, pos, player_ref=None):
+        self.hp = self.max_hp
+        self.player_ref = player_ref
+        self.pos = pygame.math.Vector2(pos)
         self.rect = self.image.get_rect(center=pos)
         self.vx = 0.0
         self.vy = 0.0
@@ -200,15 +241,20 @@ class Enemy(pygame.sprite.Sprite):
         self.pos.x += self.vx * dt
         self.pos.y += self.vy * dt
         self.rect.center = (int(self.pos.x), int(self.pos.y))
+        if self.rect.top > DESPAWN_Y:
+            self.kill()
 
 
 # ---------------- BasicEnemy ----------------
 class BasicEnemy(Enemy):
     def __init__(self, pos=(240, -40), hp=1, speed=80, player_ref=None):
+        self.speed = speed
         img = load_image_safe(ENEMY_IMG, (48, 48), (200, 80, 80))
         super().__init__(pos=pos, hp=hp, image=img, size=(48, 48), player_ref=player_ref)
-        self.speed = speed
-        self.vy = speed
+
+    def reset(self, pos, player_ref=None):
+        super().reset(pos, player_ref)
+        self.vy = self.speed
 
     def update(self, dt):
         if self.player_ref is not None and hasattr(self.player_ref, "rect"):
@@ -227,29 +273,44 @@ class BasicEnemy(Enemy):
 
 # ---------------- ZigZagEnemy ----------------
 class ZigZagEnemy(Enemy):
+    kind = KIND_ZIGZAG
+
     def __init__(self, pos=(240, -40), hp=1, dy=120, amplitude=60, frequency=1.0, player_ref=None):
-        img = load_image_safe(ZIGZAG_IMG, (48, 48), (180, 110, 80))
-        super().__init__(pos=pos, hp=hp, image=img, size=(48, 48), player_ref=player_ref)
-        self.base_y = pos[1]
         self.dy = dy
         self.amplitude = amplitude
         self.frequency = frequency
+        # frequência angular pré-calculada (rad/s) para o passo de movimento
+        self.omega = frequency * 2.0 * math.pi
+        img = load_image_safe(ZIGZAG_IMG, (48, 48), (180, 110, 80))
+        super().__init__(pos=pos, hp=hp, image=img, size=(48, 48), player_ref=player_ref)
+
+    def reset(self, pos, player_ref=None):
+        super().reset(pos, player_ref)
+        self.base_y = pos[1]
         self.t = 0.0
 
     def update(self, dt):
         self.t += dt
         self.vy = self.dy
-        self.pos.x += math.sin(self.t * self.frequency * 2.0 * math.pi) * self.amplitude * dt
+        self.pos.x += math.sin(self.t * self.omega) * self.amplitude * dt
         self.pos.y += self.vy * dt
         self.rect.center = (int(self.pos.x), int(self.pos.y))
+        if self.rect.top > DESPAWN_Y:
+            self.kill()
 
 
 # ---------------- FastEnemy ----------------
 class FastEnemy(Enemy):
+    kind = KIND_FAST
+
     def __init__(self, pos=(240, -40), hp=1, dy=240, player_ref=None):
+        self.dy = dy
         img = load_image_safe(FAST_IMG, (40, 40), (240, 140, 60))
         super().__init__(pos=pos, hp=hp, image=img, size=(40, 40), player_ref=player_ref)
-        self.vy = dy
+
+    def reset(self, pos, player_ref=None):
+        super().reset(pos, player_ref)
+        self.vy = self.dy
 
     def update(self, dt):
         super().update(dt)
@@ -257,16 +318,23 @@ class FastEnemy(Enemy):
 
 # ---------------- ShooterEnemy ----------------
 class ShooterEnemy(Enemy):
+    kind = KIND_SHOOTER
+    shoots = True
+
     def __init__(self, pos=(240, -40), hp=2, dy=90, stop_distance=200, shoot_cooldown=1.6,
                  bullet_speed=180, player_ref=None):
+        self.dy = dy
+        self.stop_y = stop_distance
+        self.shoot_cooldown = shoot_cooldown
+        self.bullet_speed = bullet_speed
         img = load_image_safe(SHOOTER_IMG, (56, 56), (200, 50, 120))
         super().__init__(pos=pos, hp=hp, image=img, size=(56, 56), player_ref=player_ref)
-        self.vy = dy
-        self.stop_y = stop_distance
+
+    def reset(self, pos, player_ref=None):
+        super().reset(pos, player_ref)
+        self.vy = self.dy
         self.stopped = False
-        self.shoot_cooldown = shoot_cooldown
         self.shoot_timer = 0.0
-        self.bullet_speed = bullet_speed
         self.new_bullets = []
 
     def update(self, dt):
@@ -289,22 +357,22 @@ class ShooterEnemy(Enemy):
                     dist = math.hypot(dx, dy) or 1.0
                     vx = dx / dist * self.bullet_speed
                     vy = dy / dist * self.bullet_speed
-                    b = EnemyBullet((cx, cy + 10), vx, vy, speed=self.bullet_speed)
+                    b = EnemyBullet.acquire((cx, cy + 10), vx, vy, speed=self.bullet_speed)
                     self.new_bullets.append(b)
                 else:
-                    b = EnemyBullet(self.rect.center, 0, self.bullet_speed, speed=self.bullet_speed)
+                    b = EnemyBullet.acquire(self.rect.center, 0, self.bullet_speed, speed=self.bullet_speed)
                     self.new_bullets.append(b)
 
         self.rect.center = (int(self.pos.x), int(self.pos.y))
 
-    def pop_pending_bullet(self):
-        if self.new_bullets:
-            return self.new_bullets.pop(0)
-        return None
-
 
 # ---------------- BossEnemy ----------------
 class BossEnemy(Enemy):
+    # boss é único por partida: não vale guardar no pool
+    pool_limit = 0
+    kind = KIND_BOSS
+    shoots = True
+
     def __init__(self, pos=(SCREEN_WIDTH // 2, -220), dy=60, start_y=100, hp=50, speed_x=120, player_ref=None):
         size = (120, 80)
         img = load_image_safe(BOSS_IMG, size, (150, 50, 60))
@@ -358,7 +426,7 @@ class BossEnemy(Enemy):
                 rad = math.radians(a)
                 vx = math.sin(rad) * 300
                 vy = math.cos(rad) * 300
-                self.new_bullets.append(BossBullet((cx, cy + 20), vx, vy, speed=300))
+                self.new_bullets.append(BossBullet.acquire((cx, cy + 20), vx, vy, speed=300))
 
         elif self.pattern_index == 1:
             left_x = 60
@@ -368,11 +436,11 @@ class BossEnemy(Enemy):
                 rad = math.radians(angle)
                 vx = math.sin(rad) * 260
                 vy = math.cos(rad) * 260
-                self.new_bullets.append(BossBullet((left_x, cy + 20), vx, vy, speed=260))
+                self.new_bullets.append(BossBullet.acquire((left_x, cy + 20), vx, vy, speed=260))
                 rad2 = math.radians(-angle)
                 vx2 = math.sin(rad2) * 260
                 vy2 = math.cos(rad2) * 260
-                self.new_bullets.append(BossBullet((right_x, cy + 20), vx2, vy2, speed=260))
+                self.new_bullets.append(BossBullet.acquire((right_x, cy + 20), vx2, vy2, speed=260))
 
         elif self.pattern_index == 2:
             gap_center = random.randint(120, SCREEN_WIDTH - 120)
@@ -381,7 +449,7 @@ class BossEnemy(Enemy):
             for x in range(40, SCREEN_WIDTH, step):
                 if gap_center - gap_width // 2 <= x <= gap_center + gap_width // 2:
                     continue
-                self.new_bullets.append(BossBullet((x, cy + 20), 0, 300, speed=300))
+                self.new_bullets.append(BossBullet.acquire((x, cy + 20), 0, 300, speed=300))
 
         else:
             base = random.randint(0, 60)
@@ -392,4 +460,4 @@ class BossEnemy(Enemy):
                 vy = math.cos(rad) * 240
                 if i == 4:
                     continue
-                self.new_bullets.append(BossBullet((cx, cy + 20), vx, vy, speed=240))
+                self.new_bullets.append(BossBullet.acquire((cx, cy + 20), vx, vy, speed=240))
@@ -2,19 +2,46 @@
 # Jogo principal (com desenho de barras de vida para inimigos e logs claros)
 #
 import os
-import random
 import time
+import random
+import itertools
+import logging
+import threading
 import pygame
 
 from src.player import Player
+from src.enemy import (BasicEnemy, ZigZagEnemy, FastEnemy, ShooterEnemy, BossEnemy, EnemyBullet, BossBullet,
+                       KIND_SHOOTER, KIND_BOSS)
 from src.bullet import Bullet
-from src.enemy import BasicEnemy, ZigZagEnemy, FastEnemy, ShooterEnemy, BossEnemy, BossBullet
 from src.background import ParallaxBackground
+from src.spatial_hash import SpatialHash
 
 # ----------------- Configurações -----------------
 SCREEN_WIDTH = 480
 SCREEN_HEIGHT = 800
 FPS = 60
+# taxa do loop enquanto a partida está pausada (a tela parada não precisa de 60 FPS)
+PAUSED_FPS = 10
+# teto do dt de um frame (s): evita saltos depois de arrastar a janela, breakpoints etc.
+MAX_DT = 0.1
+# evento do timer do SDL que dispara o spawn de inimigos
+SPAWN_EVENT = pygame.USEREVENT + 1
+# únicos tipos de evento que o jogo trata; o resto é bloqueado já no SDL e nem chega à fila
+HANDLED_EVENT_TYPES = (
+    pygame.QUIT, pygame.KEYDOWN, pygame.MOUSEBUTTONDOWN, pygame.MOUSEMOTION,
+    pygame.WINDOWMINIMIZED, pygame.WINDOWHIDDEN, pygame.WINDOWRESTORED,
+    pygame.WINDOWSHOWN, pygame.WINDOWEXPOSED, SPAWN_EVENT,
+)
+# eventos de janela -> visibilidade resultante (Game._visible)
+WINDOW_VISIBILITY_EVENTS = {
+    pygame.WINDOWMINIMIZED: False,
+    pygame.WINDOWHIDDEN: False,
+    pygame.WINDOWRESTORED: True,
+    pygame.WINDOWSHOWN: True,
+    pygame.WINDOWEXPOSED: True,
+}
+# mensagens de depuração do loop de jogo (desligadas: print no terminal pode travar o frame)
+DEBUG = False
 
 ASSETS_DIR = os.path.normpath(os.path.join(os.path.dirname(__file__), "..", "assets"))
 IMAGES_DIR = os.path.join(ASSETS_DIR, "images")
@@ -27,14 +54,40 @@ BOSS_APPEAR_PATH = os.path.join(SOUNDS_DIR, "boss_appear.mp3")
 VICTORY_MUSIC_PATH = os.path.join(SOUNDS_DIR, "victory_music.mp3")
 
 OBST_IMAGE_PATH = os.path.join(IMAGES_DIR, "obst.png")
-VICTORY_IMAGE_PATH = os.path.join(IMAGES_DIR, "victory_image.png")
 
 BOSS_HP_BAR_RECT = pygame.Rect(12, 12, 360, 18)
+# área interna (preenchida pela vida) da barra do boss
+BOSS_HP_INNER_RECT = BOSS_HP_BAR_RECT.inflate(-6, -6)
 BOSS_NAME = "Boss final"
 FONT_NAME = "arial"
 
 PLAYER_HITBOX_SHRINK_FACTOR = 0.5
 
+# limite de superfícies de texto guardadas em Game._text_cache
+TEXT_CACHE_MAX = 256
+
+logger = logging.getLogger(__name__)
+
+# tipos de inimigo (Enemy.kind) que sempre mostram barra de vida
+ALWAYS_HP_BAR_KINDS = frozenset((KIND_SHOOTER, KIND_BOSS))
+
+# tipos de inimigo sorteados no spawn e seus pesos (acumulados uma única vez)
+ENEMY_SPAWN_TYPES = (BasicEnemy, ZigZagEnemy, FastEnemy, ShooterEnemy)
+ENEMY_SPAWN_WEIGHTS = (0.5, 0.2, 0.15, 0.15)
+ENEMY_SPAWN_CUM_WEIGHTS = tuple(itertools.accumulate(ENEMY_SPAWN_WEIGHTS))
+# faixa horizontal de spawn, já no formato [início, fim) do randrange
+ENEMY_SPAWN_X_RANGE = (30, SCREEN_WIDTH - 29)
+# instâncias construídas já no __init__ para cada pool: (classe, quantidade, args do construtor)
+POOL_PREFILL = (
+    (Bullet, 32, ()),
+    (EnemyBullet, 32, ((0, 0), 0, 0)),
+    (BossBullet, 48, ((0, 0), 0, 0)),
+    (BasicEnemy, 8, ()),
+    (ZigZagEnemy, 8, ()),
+    (FastEnemy, 8, ()),
+    (ShooterEnemy, 8, ()),
+)
+
 
 class Pickup(pygame.sprite.Sprite):
     def __init__(self, pos=(240, 400)):
@@ -56,7 +109,7 @@ class Pickup(pygame.sprite.Sprite):
             surf = pygame.Surface((64, 64), pygame.SRCALPHA)
             pygame.draw.circle(surf, (255, 220, 50), (32, 32), 28)
             pygame.draw.circle(surf, (200, 150, 30), (32, 32), 20)
-            self.image = surf
+            self.image = surf.convert_alpha()
 
         self.rect = self.image.get_rect(center=pos)
 
@@ -75,6 +128,11 @@ def collide_with_shrunken_player(a, b):
         return a.rect.colliderect(b.rect)
 
 
+def collide_player_with(player, sprite):
+    """collide_with_shrunken_player com o player como 1º argumento (ordem usada por spritecollide)."""
+    return collide_with_shrunken_player(sprite, player)
+
+
 class Game:
     def __init__(self):
         pygame.init()
@@ -84,8 +142,34 @@ class Game:
             print("Aviso: mixer de áudio não pôde ser inicializado — sem som.")
 
         self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+        self.screen_rect = self.screen.get_rect()
+        pygame.event.set_blocked(None)
+        pygame.event.set_allowed(HANDLED_EVENT_TYPES)
+        # fundo liso usado quando o ParallaxBackground não está disponível (já no formato do display)
+        self._bg_surf = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT)).convert()
+        self._bg_surf.fill((30, 40, 80))
         self.clock = pygame.time.Clock()
         self.running = True
+        # dt do último frame (s), usado pelo draw para limitar a troca do título da janela
+        self.last_dt = 0.0
+        self._caption_accum = 0.0
+        self._last_caption_fps = -1
+        # False enquanto a janela está minimizada/escondida: o loop não atualiza nem desenha
+        self._visible = True
+        # True quando a tela de pausa já foi desenhada e nada mudou desde então (ver run)
+        self._paused_rendered = False
+        # teclas de ação (borda de KEYDOWN) durante a partida -> método; teclas seguradas usam get_pressed
+        self._keydown_actions = {pygame.K_ESCAPE: self._toggle_pause}
+        # despacho de eventos por estado do jogo e, durante a partida, por tipo de evento
+        self._state_event_handlers = {
+            "menu": self._handle_menu_event,
+            "playing": self._handle_playing_event,
+        }
+        self._playing_event_handlers = {
+            pygame.KEYDOWN: self._on_playing_keydown,
+            pygame.MOUSEBUTTONDOWN: self._on_playing_click,
+            SPAWN_EVENT: self._on_spawn_event,
+        }
 
         try:
             self.background = ParallaxBackground(screen_size=(SCREEN_WIDTH, SCREEN_HEIGHT),
@@ -94,18 +178,17 @@ class Game:
             print(f"Aviso: falha ao criar ParallaxBackground: {e}")
             self.background = None
 
-        self.shot_sound = None
-        if os.path.isfile(SHOT_SOUND_PATH):
-            try:
-                self.shot_sound = pygame.mixer.Sound(SHOT_SOUND_PATH)
-            except Exception:
-                self.shot_sound = None
-
         self.menu_music = MENU_MUSIC_PATH if os.path.isfile(MENU_MUSIC_PATH) else None
         self.game_music = GAME_MUSIC_PATH if os.path.isfile(GAME_MUSIC_PATH) else None
         self.boss_appear_music = BOSS_APPEAR_PATH if os.path.isfile(BOSS_APPEAR_PATH) else None
         self.victory_music = VICTORY_MUSIC_PATH if os.path.isfile(VICTORY_MUSIC_PATH) else None
 
+        # efeitos decodificados numa thread: a janela abre sem esperar o disco.
+        # Enquanto não ficam prontos valem None (o tiro sai sem som; o boss carrega na hora)
+        self.shot_sound = None
+        self.boss_appear_sound = None
+        threading.Thread(target=self._load_sounds, daemon=True).start()
+
         self.boss_sound = None
         self.state = "menu"
         self.menu_playing = False
@@ -113,6 +196,8 @@ class Game:
         btn_w, btn_h = 220, 56
         self.start_button_rect = pygame.Rect((SCREEN_WIDTH // 2 - btn_w // 2,
                                               SCREEN_HEIGHT - 220, btn_w, btn_h))
+        # hover do botão START: atualizado por MOUSEMOTION, lido em _draw_menu
+        self._start_hover = False
 
         self.title_image = None
         TITLE_IMAGE_PATH = os.path.join(IMAGES_DIR, "title_image.png")
@@ -128,11 +213,64 @@ class Game:
             except Exception:
                 self.title_image = None
 
+        # imagem da Obst da tela de vitória: carregada e escalada uma vez aqui, não a cada vitória
+        self.victory_image = None
+        if os.path.isfile(OBST_IMAGE_PATH):
+            try:
+                img = pygame.image.load(OBST_IMAGE_PATH).convert_alpha()
+                maxw, maxh = 160, 160
+                w, h = img.get_size()
+                scale = min(1.0, maxw / w if w > 0 else 1.0, maxh / h if h > 0 else 1.0)
+                if scale < 1.0:
+                    img = pygame.transform.smoothscale(img, (int(w * scale), int(h * scale)))
+                self.victory_image = img
+            except Exception:
+                self.victory_image = None
+        if self.victory_image is None:
+            vs = pygame.Surface((96, 96)).convert()
+            vs.fill((200, 180, 60))
+            pygame.draw.rect(vs, (140, 110, 20), vs.get_rect(), 4)
+            self.victory_image = vs
+
         self.font_title = pygame.font.SysFont(FONT_NAME, 36, bold=True)
         self.font_button = pygame.font.SysFont(FONT_NAME, 28, bold=True)
         self.font_instruct = pygame.font.SysFont(FONT_NAME, 18)
         self.font = pygame.font.SysFont(FONT_NAME, 20)
         self.font_boss = pygame.font.SysFont(FONT_NAME, 18, bold=True)
+        # nome do boss e moldura da barra de vida não mudam: prontos uma vez aqui
+        self._boss_name_surf = self.font_boss.render(BOSS_NAME, True, (240, 240, 240))
+        self._boss_bar_surf = pygame.Surface(BOSS_HP_BAR_RECT.size, pygame.SRCALPHA)
+        bar_local = self._boss_bar_surf.get_rect()
+        pygame.draw.rect(self._boss_bar_surf, (30, 30, 30), bar_local, border_radius=4)
+        pygame.draw.rect(self._boss_bar_surf, (200, 200, 200), bar_local, 2, border_radius=4)
+        pygame.draw.rect(self._boss_bar_surf, (40, 40, 40), BOSS_HP_INNER_RECT.move(-BOSS_HP_BAR_RECT.x, -BOSS_HP_BAR_RECT.y),
+                         border_radius=3)
+        self._boss_bar_surf = self._boss_bar_surf.convert_alpha()
+        # fontes das telas de pausa/vitória/game over: SysFont varre o disco, então criamos uma vez só
+        self.font_gameover = pygame.font.SysFont(FONT_NAME, 48)
+        self.font_pause_big = pygame.font.SysFont(FONT_NAME, 56, bold=True)
+        self.font_victory = pygame.font.SysFont(FONT_NAME, 14, bold=True)
+        self.font_victory_instr = pygame.font.SysFont(FONT_NAME, 16)
+        # título fixo do game over, renderizado uma vez
+        self._go_text_surf = self.font_gameover.render("GAME OVER", True, (200, 50, 50))
+        self._go_text_rect = self._go_text_surf.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 - 20))
+        # véu escuro da pausa: cor sólida com alpha de superfície (blit mais barato que SRCALPHA por pixel)
+        self._pause_overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT)).convert()
+        self._pause_overlay.fill((0, 0, 0))
+        self._pause_overlay.set_alpha(150)
+        # textos fixos da pausa, também renderizados uma vez
+        pause_title = self.font_pause_big.render("PAUSADO", True, (240, 240, 220))
+        pause_hint = self.font_instruct.render("Pressione ESC para continuar", True, (220, 220, 220))
+        self._pause_texts = (
+            (pause_title, pause_title.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 - 20))),
+            (pause_hint, pause_hint.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 40))),
+        )
+        # (texto, cor) -> Surface já renderizada do HUD
+        self._text_cache = {}
+        # valores exibidos no HUD no último frame e a lista de blits correspondente;
+        # os textos só são formatados de novo quando algum valor muda
+        self._hud_values = None
+        self._hud_blits = ()
 
         self.instructions = [
             "INSTRUÇÕES:",
@@ -148,20 +286,33 @@ class Game:
         self.paused = False
 
         self.all_sprites = pygame.sprite.Group()
-        self.player_group = pygame.sprite.Group()
         self.bullets_group = pygame.sprite.Group()
         self.enemy_bullets_group = pygame.sprite.Group()
         self.enemies_group = pygame.sprite.Group()
+        # subconjunto de enemies_group com os inimigos que atiram (shooters e boss)
+        self.shooters_group = pygame.sprite.Group()
         self.pickups_group = pygame.sprite.Group()
 
         self.player = None
-
-        self.spawn_interval = 1.0
-        self.spawn_timer = 0.0
-        self.difficulty_timer = 0.0
-        self.difficulty_period = 12.0
+        # segundos restantes na tela de game over antes de encerrar (estado "game_over")
+        self._go_timer = 0.0
+        # índice espacial persistente dos inimigos para as colisões com balas; sync() o atualiza
+        # a cada frame mexendo só em quem mudou de células ou saiu do grupo
+        self.enemy_hash = SpatialHash()
+        # pools preenchidos antes da partida: o primeiro tiro/spawn não paga construção nem load de imagem
+        for cls, count, args in POOL_PREFILL:
+            cls.prefill(count, *args)
+
+        # timers de spawn/dificuldade em milissegundos inteiros (sem deriva de float)
+        # o spawn em si é disparado por SPAWN_EVENT (pygame.time.set_timer), ver _set_spawn_timer
+        self.spawn_interval_start_ms = 1000
+        self.spawn_interval_ms = self.spawn_interval_start_ms
+        self.difficulty_timer_ms = 0
+        # fração de ms do dt (perf_counter) ainda não contada, levada para o próximo frame
+        self._difficulty_ms_carry = 0.0
+        self.difficulty_period_ms = 12000
         self.difficulty_reduction_factor = 0.92
-        self.spawn_interval_min = 0.25
+        self.spawn_interval_min_ms = 250
 
         self.boss_phase_started = False
         self.boss_spawned = False
@@ -169,7 +320,23 @@ class Game:
 
         self.menu_start()
 
+    def _load_sounds(self):
+        # roda fora da thread principal; cada atributo só é publicado já pronto
+        if os.path.isfile(SHOT_SOUND_PATH):
+            try:
+                self.shot_sound = pygame.mixer.Sound(SHOT_SOUND_PATH)
+            except Exception:
+                self.shot_sound = None
+        if self.boss_appear_music:
+            try:
+                self.boss_appear_sound = pygame.mixer.Sound(self.boss_appear_music)
+            except Exception:
+                self.boss_appear_sound = None
+
     def menu_start(self):
+        # MOUSEMOTION só interessa ao hover do botão START
+        pygame.event.set_allowed(pygame.MOUSEMOTION)
+        self._start_hover = bool(self.start_button_rect.collidepoint(pygame.mouse.get_pos()))
         if self.menu_music:
             try:
                 pygame.mixer.music.load(self.menu_music)
@@ -189,6 +356,7 @@ class Game:
 
     def start_game(self):
         self.menu_stop()
+        pygame.event.set_blocked(pygame.MOUSEMOTION)
         if self.game_music:
             try:
                 pygame.mixer.music.load(self.game_music)
@@ -202,16 +370,11 @@ class Game:
         self.total_time = 0.0
         self.paused = False
 
-        self.all_sprites = pygame.sprite.Group()
-        self.player_group = pygame.sprite.Group()
-        self.bullets_group = pygame.sprite.Group()
-        self.enemy_bullets_group = pygame.sprite.Group()
-        self.enemies_group = pygame.sprite.Group()
-        self.pickups_group = pygame.sprite.Group()
+        # os grupos criados no __init__ são reaproveitados; só os sprites da partida anterior saem
+        self._clear_sprites()
 
         self.player = Player(pos=(SCREEN_WIDTH // 2, SCREEN_HEIGHT - 120))
         self.all_sprites.add(self.player)
-        self.player_group.add(self.player)
 
         self.boss_phase_started = False
         self.boss_spawned = False
@@ -223,11 +386,57 @@ class Game:
                 pass
             self.boss_sound = None
 
+        self.spawn_interval_ms = self.spawn_interval_start_ms
+        self.difficulty_timer_ms = 0
+        self._difficulty_ms_carry = 0.0
+        self._set_spawn_timer(self.spawn_interval_ms)
+
         self.state = "playing"
 
+    def _clear_sprites(self):
+        # todo sprite da partida também está em all_sprites; kill() tira de todos os grupos
+        # e devolve tiros/inimigos aos pools para a próxima partida
+        for sprite in self.all_sprites.sprites():
+            sprite.kill()
+
+    def _set_spawn_timer(self, interval_ms):
+        # interval_ms = 0 desliga o timer; chamar de novo substitui o intervalo anterior
+        pygame.time.set_timer(SPAWN_EVENT, interval_ms)
+
     def run(self):
+        # métodos usados a cada frame ligados a locais (evita LOAD_ATTR repetido no loop)
+        clock_tick = self.clock.tick
+        perf_counter = time.perf_counter
+        handle_events = self.handle_events
+        update = self.update
+        draw = self.draw
+        last_t = perf_counter()
         while self.running:
-            dt = self.clock.tick(FPS) / 1000.0
+            # clock.tick só limita o FPS; o dt é medido com perf_counter (resolução sub-ms)
+            clock_tick(PAUSED_FPS if self._paused_rendered else FPS)
+            now = perf_counter()
+            dt = min(now - last_t, MAX_DT)
+            last_t = now
+            self.last_dt = dt
+
+            handle_events()
+            if not self._visible:
+                # janela minimizada: só continua ouvindo eventos, sem gastar CPU com update/draw
+                pygame.time.wait(50)
+                continue
+
+            if self.state == "playing" and self.paused:
+                # pausado nada se mexe: desenha a cena com o véu uma vez e depois só trata eventos
+                if not self._paused_rendered:
+                    draw()
+                    self._paused_rendered = True
+                continue
+            if self._paused_rendered:
+                # primeiro frame depois de despausar: o dt medido é o tick lento da pausa
+                # (~1/PAUSED_FPS), tempo em que o jogo estava parado; não avança nada nele
+                self._paused_rendered = False
+                dt = 0.0
+                self.last_dt = dt
 
             if self.background:
                 try:
@@ -235,22 +444,34 @@ class Game:
                 except Exception:
                     self.background = None
 
-            self.handle_events()
             if self.state == "playing" and not self.paused:
                 self.total_time += dt
-                self.update(dt)
-            self.draw()
+                update(dt)
+            elif self.state == "game_over":
+                # o loop continua girando (eventos/janela respondem) enquanto a tela de game over aparece
+                self._go_timer -= dt
+                if self._go_timer <= 0:
+                    self.running = False
+            draw()
 
         self.quit()
 
     def handle_events(self):
+        state_handlers = self._state_event_handlers
         for event in pygame.event.get():
-            if event.type == pygame.QUIT:
+            etype = event.type
+            if etype == pygame.QUIT:
                 self.running = False
-            if self.state == "menu":
-                self._handle_menu_event(event)
-            elif self.state == "playing":
-                self._handle_playing_event(event)
+            else:
+                visible = WINDOW_VISIBILITY_EVENTS.get(etype)
+                if visible is not None:
+                    self._visible = visible
+                    # janela reexposta: a tela de pausa precisa ser redesenhada
+                    self._paused_rendered = False
+            # o estado pode mudar no meio da fila (ex.: ENTER no menu inicia a partida)
+            handler = state_handlers.get(self.state)
+            if handler is not None:
+                handler(event)
 
     def _handle_menu_event(self, event):
         if event.type == pygame.KEYDOWN and event.key == pygame.K_RETURN:
@@ -258,16 +479,31 @@ class Game:
         elif event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
             if self.start_button_rect.collidepoint(event.pos):
                 self.start_game()
+        elif event.type == pygame.MOUSEMOTION:
+            self._start_hover = bool(self.start_button_rect.collidepoint(event.pos))
+
+    def _toggle_pause(self):
+        self.paused = not self.paused
 
     def _handle_playing_event(self, event):
-        if event.type == pygame.KEYDOWN:
-            if event.key == pygame.K_ESCAPE:
-                self.paused = not self.paused
-            elif not self.paused and event.key == pygame.K_SPACE:
-                self._attempt_player_shoot(pygame.mouse.get_pos())
-        elif event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
-            if not self.paused:
-                self._attempt_player_shoot(event.pos)
+        handler = self._playing_event_handlers.get(event.type)
+        if handler is not None:
+            handler(event)
+
+    def _on_playing_keydown(self, event):
+        action = self._keydown_actions.get(event.key)
+        # com o jogo pausado só o ESC (despausar) é atendido
+        if action is not None and (not self.paused or event.key == pygame.K_ESCAPE):
+            action()
+
+    def _on_playing_click(self, event):
+        if event.button == 1 and not self.paused:
+            self._attempt_player_shoot(event.pos)
+
+    def _on_spawn_event(self, event):
+        # minimizado o jogo fica parado, então não acumula inimigos
+        if not self.paused and self._visible:
+            self.spawn_enemy()
 
     def _attempt_player_shoot(self, target_pos=None):
         try:
@@ -284,55 +520,56 @@ class Game:
                     pass
 
     def update(self, dt):
+        # estado do teclado lido uma vez por frame: movimento do player e tiro contínuo
+        keys = pygame.key.get_pressed()
+        self.player.apply_input(keys)
+        # um update por grupo (cada laço só vê um tipo de sprite); Pickup não tem update
         try:
-            self.all_sprites.update(dt)
+            self.player.update(dt)
+            self.bullets_group.update(dt)
+            self.enemies_group.update(dt)
+            self.enemy_bullets_group.update(dt)
         except Exception:
             pass
 
-        # adiciona tiros recém-criados do boss e shooters
-        for enemy in list(self.enemies_group):
-            if isinstance(enemy, BossEnemy) and getattr(enemy, "new_bullets", None):
-                for b in enemy.new_bullets:
-                    self.all_sprites.add(b)
-                    self.enemy_bullets_group.add(b)
-                enemy.new_bullets.clear()
-            if isinstance(enemy, ShooterEnemy) and getattr(enemy, "new_bullets", None):
-                for b in enemy.new_bullets:
-                    self.all_sprites.add(b)
-                    self.enemy_bullets_group.add(b)
-                enemy.new_bullets.clear()
+        # SPACE segurado = tiro contínuo; o cooldown do Player limita a cadência
+        if keys[pygame.K_SPACE]:
+            self._attempt_player_shoot()
 
-        # também tenta pop_pending_bullet (compatibilidade)
-        for enemy in list(self.enemies_group):
-            if isinstance(enemy, ShooterEnemy):
-                try:
-                    b = enemy.pop_pending_bullet()
-                except Exception:
-                    b = None
-                if b is not None:
+        # recolhe tiros recém-criados (boss e shooters); quem sai pela parte de baixo
+        # da tela já se removeu sozinho no próprio update
+        for enemy in self.shooters_group:
+            pending = enemy.new_bullets
+            if pending:
+                for b in pending:
                     self.all_sprites.add(b)
                     self.enemy_bullets_group.add(b)
+                pending.clear()
 
         if not self.boss_phase_started and self.total_time >= 60.0:
             self.boss_phase_started = True
-            print("Boss phase iniciado!")
+            self._set_spawn_timer(0)
+            if DEBUG:
+                logger.debug("Boss phase iniciado!")
 
         if not self.boss_phase_started:
-            self.spawn_timer += dt
-            if self.spawn_timer >= self.spawn_interval:
-                self.spawn_timer -= self.spawn_interval
-                self.spawn_enemy()
-
-            self.difficulty_timer += dt
-            if self.difficulty_timer >= self.difficulty_period:
-                self.difficulty_timer -= self.difficulty_period
-                self.spawn_interval = max(self.spawn_interval * self.difficulty_reduction_factor,
-                                          self.spawn_interval_min)
+            # os timers de dificuldade contam em ms inteiros; a sobra sub-ms do dt fica no carry
+            # (arredondar cada frame acumulava erro: 1/60 s virava 17 ms, 2% rápido)
+            elapsed_ms = dt * 1000.0 + self._difficulty_ms_carry
+            dt_ms = int(elapsed_ms)
+            self._difficulty_ms_carry = elapsed_ms - dt_ms
+            self.difficulty_timer_ms += dt_ms
+            if self.difficulty_timer_ms >= self.difficulty_period_ms:
+                self.difficulty_timer_ms -= self.difficulty_period_ms
+                self.spawn_interval_ms = max(int(self.spawn_interval_ms * self.difficulty_reduction_factor),
+                                             self.spawn_interval_min_ms)
+                self._set_spawn_timer(self.spawn_interval_ms)
         else:
-            non_boss = [e for e in self.enemies_group if not isinstance(e, BossEnemy)]
-            if not non_boss and not self.boss_spawned:
+            # antes do boss nascer todo inimigo vivo é comum: basta o grupo estar vazio
+            if not self.boss_spawned and not self.enemies_group:
                 boss = BossEnemy(pos=(SCREEN_WIDTH // 2, -220), dy=60, start_y=100, hp=50, speed_x=140, player_ref=self.player)
                 self.enemies_group.add(boss)
+                self.shooters_group.add(boss)
                 self.all_sprites.add(boss)
                 self.boss_spawned = True
                 self.boss_ref = boss
@@ -342,16 +579,28 @@ class Game:
                     pass
                 if self.boss_appear_music:
                     try:
-                        self.boss_sound = pygame.mixer.Sound(self.boss_appear_music)
+                        self.boss_sound = self.boss_appear_sound or pygame.mixer.Sound(self.boss_appear_music)
                         self.boss_sound.play(-1)
                     except Exception:
                         pass
 
-        collisions = pygame.sprite.groupcollide(self.bullets_group, self.enemies_group, True, False)
-        for bullet, enemies_hit in collisions.items():
-            for enemy in enemies_hit:
+        # balas x inimigos: cada bala só é testada contra os inimigos das células que ela toca
+        enemy_hash = self.enemy_hash
+        enemy_hash.sync(self.enemies_group)
+        query = enemy_hash.query
+        colliderect = pygame.Rect.colliderect
+        for bullet in (self.bullets_group.sprites() if enemy_hash.cells else ()):
+            brect = bullet.rect
+            hits = [e for e in query(brect) if colliderect(brect, e.rect)]
+            if not hits:
+                continue
+            bullet.kill()
+            for enemy in hits:
+                # inimigo já destruído por outra bala neste mesmo frame
+                if not enemy.alive():
+                    continue
                 if enemy.take_damage(1):
-                    if isinstance(enemy, BossEnemy):
+                    if enemy.kind == KIND_BOSS:
                         obst = Pickup(enemy.rect.center)
                         self.pickups_group.add(obst)
                         self.all_sprites.add(obst)
@@ -377,67 +626,64 @@ class Game:
             self.trigger_victory()
             return
 
-        if pygame.sprite.groupcollide(self.enemy_bullets_group, self.player_group, True, False, collided=collide_with_shrunken_player):
+        if pygame.sprite.spritecollide(self.player, self.enemy_bullets_group, True, collided=collide_player_with):
             self.lives -= 1
             if self.lives <= 0:
-                self.display_game_over()
-                pygame.time.delay(1500)
-                self.running = False
+                self._enter_game_over()
                 return
 
         if pygame.sprite.spritecollide(self.player, self.enemies_group, dokill=False, collided=collide_with_shrunken_player):
             self.lives -= 1
             if self.lives <= 0:
-                self.display_game_over()
-                pygame.time.delay(1500)
-                self.running = False
+                self._enter_game_over()
 
-        for enemy in list(self.enemies_group):
-            if enemy.rect.top > SCREEN_HEIGHT + 120:
-                enemy.kill()
+    def _enter_game_over(self):
+        self._set_spawn_timer(0)
+        self.state = "game_over"
+        self._go_timer = 1.5
 
     def spawn_enemy(self):
         if self.boss_phase_started:
             return
-        x = random.randint(30, SCREEN_WIDTH - 30)
+        x = random.randrange(*ENEMY_SPAWN_X_RANGE)
         y = -50
-        e = random.choices(
-            [BasicEnemy, ZigZagEnemy, FastEnemy, ShooterEnemy],
-            weights=[0.5, 0.2, 0.15, 0.15],
-            k=1
-        )[0](pos=(x, y), player_ref=self.player)
+        # acquire reaproveita um inimigo morto do mesmo tipo quando houver
+        e = random.choices(ENEMY_SPAWN_TYPES, cum_weights=ENEMY_SPAWN_CUM_WEIGHTS, k=1)[0].acquire(
+            pos=(x, y), player_ref=self.player)
         self.enemies_group.add(e)
+        if e.shoots:
+            self.shooters_group.add(e)
         self.all_sprites.add(e)
 
     def draw(self):
+        if self.state == "game_over":
+            self.display_game_over()
+            return
+
         if self.background:
             try:
                 self.background.draw(self.screen)
             except Exception:
-                self.screen.fill((30, 40, 80))
+                self.screen.blit(self._bg_surf, (0, 0))
         else:
-            self.screen.fill((30, 40, 80))
+            self.screen.blit(self._bg_surf, (0, 0))
 
         if self.state == "menu":
             self._draw_menu()
         else:
-            self.all_sprites.draw(self.screen)
-            for p in self.pickups_group:
-                self.screen.blit(p.image, p.rect)
+            # ordem de desenho explícita, um blits() (loop em C) por grupo
+            self._draw_group(self.enemies_group)
+            self._draw_group(self.enemy_bullets_group)
+            self._draw_group(self.bullets_group)
+            # o player entra no fim do último lote (continua desenhado por cima dos pickups)
+            player = self.player
+            self._draw_group(self.pickups_group, ((player.image, player.rect),) if player is not None else ())
 
             # desenhar barras de vida para inimigos:
             for enemy in self.enemies_group:
                 try:
-                    # desenha barra se o inimigo tem hp>0 e (max_hp>1) OU se é ShooterEnemy/BossEnemy
-                    should_draw = False
-                    try:
-                        if hasattr(enemy, "hp") and hasattr(enemy, "max_hp") and enemy.max_hp > 1:
-                            should_draw = True
-                    except Exception:
-                        should_draw = False
-                    # forçar desenho para ShooterEnemy e BossEnemy (caso você tenha setado hp=1)
-                    if isinstance(enemy, (ShooterEnemy, BossEnemy)):
-                        should_draw = True
+                    # desenha barra se o inimigo tem max_hp>1 OU se é shooter/boss (mesmo com hp=1)
+                    should_draw = enemy.max_hp > 1 or enemy.kind in ALWAYS_HP_BAR_KINDS
 
                     if should_draw:
                         bar_w = enemy.rect.width
@@ -484,6 +730,14 @@ class Game:
 
         pygame.display.flip()
 
+    def _draw_group(self, group, extra=()):
+        # descarta sprites fora da tela antes de montar a lista (inimigos entrando por cima etc.);
+        # extra são pares (image, rect) desenhados no mesmo blits(), depois do grupo
+        on_screen = self.screen_rect.colliderect
+        blits = [(s.image, s.rect) for s in group if on_screen(s.rect)]
+        blits.extend(extra)
+        self.screen.blits(blits, doreturn=False)
+
     def _draw_menu(self):
         panel = pygame.Surface((SCREEN_WIDTH - 40, SCREEN_HEIGHT - 80), pygame.SRCALPHA)
         panel.fill((0, 0, 0, 80))
@@ -505,13 +759,11 @@ class Game:
             ph_rect = ph.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 - 70))
             self.screen.blit(ph, ph_rect)
 
-        mx, my = pygame.mouse.get_pos()
         rect = self.start_button_rect
         shadow = pygame.Surface((rect.width, rect.height), pygame.SRCALPHA)
         shadow.fill((0, 0, 0, 120))
         self.screen.blit(shadow, (rect.x + 4, rect.y + 6))
-        hover = rect.collidepoint(mx, my)
-        color = (40, 200, 130) if hover else (28, 160, 100)
+        color = (40, 200, 130) if self._start_hover else (28, 160, 100)
         pygame.draw.rect(self.screen, color, rect, border_radius=10)
         pygame.draw.rect(self.screen, (255, 255, 255), rect, 2, border_radius=10)
         btn_text = self.font_button.render("START", True, (255, 255, 255))
@@ -526,30 +778,59 @@ class Game:
         self.screen.blit(hint, hint.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT - 40)))
 
     def _draw_boss_hp(self, boss):
-        pygame.draw.rect(self.screen, (30, 30, 30), BOSS_HP_BAR_RECT, border_radius=4)
-        pygame.draw.rect(self.screen, (200, 200, 200), BOSS_HP_BAR_RECT, 2, border_radius=4)
-        inner = BOSS_HP_BAR_RECT.inflate(-6, -6)
+        inner = BOSS_HP_INNER_RECT
         hp_ratio = max(0.0, min(1.0, boss.hp / boss.max_hp))
         fill_w = int(inner.width * hp_ratio)
-        color = (int(50 + (1 - hp_ratio) * 100), 200, 40) if hp_ratio > 0.5 else (220, int(50 + hp_ratio * 150), 40)
-        pygame.draw.rect(self.screen, (40, 40, 40), inner, border_radius=3)
+        # degradê contínuo vermelho (220, 50, 40) -> verde (50, 200, 40), sem desvio por faixa
+        color = (int(220 - 170 * hp_ratio), int(50 + 150 * hp_ratio), 40)
+        self.screen.blit(self._boss_bar_surf, BOSS_HP_BAR_RECT)
         pygame.draw.rect(self.screen, color, (inner.x, inner.y, fill_w, inner.height), border_radius=3)
-        name_surf = self.font_boss.render(BOSS_NAME, True, (240, 240, 240))
-        self.screen.blit(name_surf, (BOSS_HP_BAR_RECT.x, BOSS_HP_BAR_RECT.y - 20))
+        self.screen.blit(self._boss_name_surf, (BOSS_HP_BAR_RECT.x, BOSS_HP_BAR_RECT.y - 20))
+
+    def _render_cached(self, text, color):
+        """Renderiza texto do HUD com self.font só quando (texto, cor) ainda não está no cache."""
+        key = (text, color)
+        surf = self._text_cache.get(key)
+        if surf is None:
+            surf = self.font.render(text, True, color)
+            if len(self._text_cache) >= TEXT_CACHE_MAX:
+                # descarta a entrada mais antiga (dict mantém ordem de inserção)
+                del self._text_cache[next(iter(self._text_cache))]
+            self._text_cache[key] = surf
+        return surf
 
     def _draw_hud(self):
-        score_surf = self.font.render(f"Score: {self.score}", True, (255, 255, 255))
-        lives_surf = self.font.render(f"Vidas: {self.lives}", True, (255, 255, 255))
-        time_surf = self.font.render(f"Tempo: {int(self.total_time)}s", True, (255, 255, 255))
-        boss_remaining = max(0, 60 - int(self.total_time))
-        boss_time_surf = self.font.render(f"Tempo para o Boss: {boss_remaining}s", True, (200, 200, 255))
-
-        self.screen.blit(score_surf, (10, 10))
-        self.screen.blit(lives_surf, (10, 34))
-        self.screen.blit(time_surf, (SCREEN_WIDTH - 200, 10))
-        self.screen.blit(boss_time_surf, (SCREEN_WIDTH - 200, 34))
+        seconds = int(self.total_time)
+        values = (self.score, self.lives, seconds)
+        if values != self._hud_values:
+            self._hud_values = values
+            boss_remaining = max(0, 60 - seconds)
+            self._hud_blits = (
+                (self._render_cached(f"Score: {self.score}", (255, 255, 255)), (10, 10)),
+                (self._render_cached(f"Vidas: {self.lives}", (255, 255, 255)), (10, 34)),
+                (self._render_cached(f"Tempo: {seconds}s", (255, 255, 255)), (SCREEN_WIDTH - 200, 10)),
+                (self._render_cached(f"Tempo para o Boss: {boss_remaining}s", (200, 200, 255)),
+                 (SCREEN_WIDTH - 200, 34)),
+            )
+
+        self.screen.blits(self._hud_blits, doreturn=False)
+
+        self._update_caption()
+
+    def _update_caption(self):
+        # set_caption conversa com o gerenciador de janelas: no máximo 2x/s e só se o FPS mudou
+        self._caption_accum += self.last_dt
+        if self._caption_accum < 0.5:
+            return
+        self._caption_accum = 0.0
+        fps = int(self.clock.get_fps())
+        if fps != self._last_caption_fps:
+            self._last_caption_fps = fps
+            pygame.display.set_caption(f"Pirata — FPS: {fps}")
 
-        pygame.display.set_caption(f"Pirata — FPS: {int(self.clock.get_fps())}")
+    def draw_pause_overlay(self):
+        self.screen.blit(self._pause_overlay, (0, 0))
+        self.screen.blits(self._pause_texts, doreturn=False)
 
     def trigger_victory(self):
         try:
@@ -571,31 +852,24 @@ class Game:
             except Exception:
                 pass
 
-        obst_surf = None
-        if os.path.isfile(OBST_IMAGE_PATH):
-            try:
-                img = pygame.image.load(OBST_IMAGE_PATH).convert_alpha()
-                maxw, maxh = 160, 160
-                w, h = img.get_size()
-                scale = min(1.0, maxw / w if w > 0 else 1.0, maxh / h if h > 0 else 1.0)
-                if scale < 1.0:
-                    img = pygame.transform.smoothscale(img, (int(w * scale), int(h * scale)))
-                obst_surf = img
-            except Exception:
-                obst_surf = None
-        if obst_surf is None:
-            vs = pygame.Surface((96, 96))
-            vs.fill((200, 180, 60))
-            pygame.draw.rect(vs, (140, 110, 20), vs.get_rect(), 4)
-            obst_surf = vs
+        obst_surf = self.victory_image
 
         message_center = (SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 - 40)
         obst_center = (SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 40)
         instr_center = (SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 120)
 
         msg = "Parabéns, você conquistou a Obst, a fruta sagrada dos sete mares!"
-        victory_font = pygame.font.SysFont(FONT_NAME, 14, bold=True)
-        instr_font = pygame.font.SysFont(FONT_NAME, 16)
+        # textos e posições não mudam durante a tela de vitória: renderiza uma vez antes do laço
+        text_surf = self.font_victory.render(msg, True, (255, 230, 120))
+        text_rect = text_surf.get_rect(center=message_center)
+        obst_rect = obst_surf.get_rect(center=obst_center)
+        instr = "Pressione R para voltar ao menu inicial"
+        instr_surf = self.font_victory_instr.render(instr, True, (220, 220, 220))
+        instr_rect = instr_surf.get_rect(center=instr_center)
+        # véu escuro sobre o fundo, alocado uma vez por tela de vitória
+        overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT)).convert()
+        overlay.fill((0, 0, 0))
+        overlay.set_alpha(200)
 
         waiting = True
         while waiting and self.running:
@@ -616,22 +890,13 @@ class Game:
             else:
                 self.screen.fill((10, 10, 10))
 
-            overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
-            overlay.fill((0, 0, 0))
-            overlay.set_alpha(200)
             self.screen.blit(overlay, (0, 0))
 
-            text_surf = victory_font.render(msg, True, (255, 230, 120))
-            text_rect = text_surf.get_rect(center=message_center)
-            self.screen.blit(text_surf, text_rect)
-
-            obst_rect = obst_surf.get_rect(center=obst_center)
-            self.screen.blit(obst_surf, obst_rect)
-
-            instr = "Pressione R para voltar ao menu inicial"
-            instr_surf = instr_font.render(instr, True, (220, 220, 220))
-            instr_rect = instr_surf.get_rect(center=instr_center)
-            self.screen.blit(instr_surf, instr_rect)
+            self.screen.blits((
+                (text_surf, text_rect),
+                (obst_surf, obst_rect),
+                (instr_surf, instr_rect),
+            ), doreturn=False)
 
             pygame.display.flip()
             self.clock.tick(30)
@@ -641,13 +906,10 @@ class Game:
         except Exception:
             pass
 
+        self._set_spawn_timer(0)
         self.state = "menu"
         self.menu_start()
-        self.all_sprites.empty()
-        self.enemies_group.empty()
-        self.enemy_bullets_group.empty()
-        self.bullets_group.empty()
-        self.pickups_group.empty()
+        self._clear_sprites()
         self.player = None
         self.boss_ref = None
         self.boss_phase_started = False
@@ -655,10 +917,8 @@ class Game:
 
     def display_game_over(self):
         self.screen.fill((10, 10, 10))
-        go_font = pygame.font.SysFont(FONT_NAME, 48)
-        text = go_font.render("GAME OVER", True, (200, 50, 50))
-        sub = self.font.render(f"Score final: {self.score}", True, (255, 255, 255))
-        self.screen.blit(text, text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 - 20)))
+        sub = self._render_cached(f"Score final: {self.score}", (255, 255, 255))
+        self.screen.blit(self._go_text_surf, self._go_text_rect)
         self.screen.blit(sub, sub.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 30)))
         pygame.display.flip()
 
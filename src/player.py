@@ -7,16 +7,17 @@
 
 import os
 import pygame
-import time
 import math
 
+from src.bullet import Bullet
+
 ASSETS_IMAGES = os.path.join(os.path.dirname(__file__), "..", "assets", "images")
 PLAYER_IMAGE_PATH = os.path.join(ASSETS_IMAGES, "player.png")
 
 # ---------- PARÂMETROS DE TUNING ----------
 SPRITE_DRAW_SIZE = (64, 64)
 DEFAULT_SPEED = 300.0
-DEFAULT_SHOOT_COOLDOWN = 0.25
+DEFAULT_SHOOT_COOLDOWN = 250  # ms
 DEFAULT_BULLET_SPEED = 700.0
 
 MAX_HORIZ_SCALE = 0.72
@@ -26,91 +27,178 @@ TILT_SPEED = 10.0
 HITBOX_SCALE = 0.55  # 55% do tamanho original (reduz ~45%)
 # -----------------------------------------
 
-class Player(pygame.sprite.Sprite):
-    def __init__(self, pos=(240, 700)):
-        super().__init__()
-        self.speed = DEFAULT_SPEED
+# resolução da tabela de inclinação: yaw em [-1, 1] vira -16..16, pitch em [0, 1] vira 0..8
+TILT_YAW_BINS = 16
+TILT_PITCH_BINS = 8
+
+# fator de normalização do movimento diagonal (1/√2)
+_INV_SQRT2 = math.sqrt(0.5)
+_Vec2 = pygame.math.Vector2
+
+# teclas de direção (setas + WASD), resolvidas uma vez no carregamento do módulo
+_K_LEFT, _K_RIGHT, _K_UP, _K_DOWN = pygame.K_LEFT, pygame.K_RIGHT, pygame.K_UP, pygame.K_DOWN
+_K_A, _K_D, _K_W, _K_S = pygame.K_a, pygame.K_d, pygame.K_w, pygame.K_s
+
 
-        # Carrega sprite (ou placeholder)
+def _build_dir_lut():
+    """16 entradas, índice = esquerda | direita<<1 | cima<<2 | baixo<<3 -> (dx, dy) já normalizado."""
+    lut = []
+    for mask in range(16):
+        dx = ((mask >> 1) & 1) - (mask & 1)
+        dy = ((mask >> 3) & 1) - ((mask >> 2) & 1)
+        if dx and dy:
+            dx *= _INV_SQRT2
+            dy *= _INV_SQRT2
+        lut.append((dx, dy))
+    return tuple(lut)
+
+
+_DIR_LUT = _build_dir_lut()
+
+# sprite base do player (já convertido e escalado), compartilhado entre instâncias
+_player_surface = None
+# sprites já comprimidos/rotacionados, indexados por (yaw_bin + TILT_YAW_BINS) * (TILT_PITCH_BINS + 1) + pitch_bin;
+# lista plana preenchida sob demanda (None = faixa ainda não renderizada)
+_tilt_cache = [None] * ((2 * TILT_YAW_BINS + 1) * (TILT_PITCH_BINS + 1))
+# tela transparente reaproveitada por _render_tilt (o rotozoom sempre devolve uma surface nova)
+_tilt_canvas = None
+
+
+def _get_player_surface():
+    """Carrega player.png (ou o placeholder) na primeira chamada; depois devolve a mesma Surface."""
+    global _player_surface
+    if _player_surface is None:
+        img = None
         if os.path.isfile(PLAYER_IMAGE_PATH):
             try:
                 img = pygame.image.load(PLAYER_IMAGE_PATH).convert_alpha()
-                img = pygame.transform.smoothscale(img, SPRITE_DRAW_SIZE)
-                self.original_image = img
+                w, h = img.get_size()
+                tw, th = SPRITE_DRAW_SIZE
+                if (w, h) != SPRITE_DRAW_SIZE:
+                    if max(w / tw, tw / w, h / th, th / h) < 1.5:
+                        # já perto do tamanho final: scale simples basta, o filtro não faz diferença
+                        img = pygame.transform.scale(img, SPRITE_DRAW_SIZE)
+                    else:
+                        img = pygame.transform.smoothscale(img, SPRITE_DRAW_SIZE)
             except Exception as e:
                 print(f"Aviso: falha ao carregar player.png: {e}")
-                self.original_image = self._make_placeholder()
-        else:
-            self.original_image = self._make_placeholder()
+                img = None
+        _player_surface = img if img is not None else Player._make_placeholder()
+    return _player_surface
+
+
+def _render_tilt(yaw, pitch):
+    """Aplica compressão horizontal + rotação no sprite base para simular virada."""
+    global _tilt_canvas
+    abs_yaw = abs(yaw)
+    horiz_scale = 1.0 - (1.0 - MAX_HORIZ_SCALE) * abs_yaw
+    yaw_rot = -yaw * MAX_YAW_ROT_DEG
+    pitch_rot = pitch * PITCH_UP_ROT_DEG
+    total_rot = yaw_rot + pitch_rot
+
+    w0,h0 = SPRITE_DRAW_SIZE
+    new_w = max(2, int(w0 * horiz_scale))
+    scaled = pygame.transform.smoothscale(_get_player_surface(), (new_w, h0))
+    canvas = _tilt_canvas
+    if canvas is None:
+        canvas = _tilt_canvas = pygame.Surface((w0, h0), pygame.SRCALPHA)
+    else:
+        canvas.fill((0, 0, 0, 0))
+    x_offset = (w0 - new_w) // 2
+    canvas.blit(scaled, (x_offset, 0))
+    # garante o formato de pixel da tela (caminho rápido de alphablit), qualquer que seja o do rotozoom
+    return pygame.transform.rotozoom(canvas, total_rot, 1.0).convert_alpha()
+
+
+class Player(pygame.sprite.Sprite):
+    def __init__(self, pos=(240, 700)):
+        super().__init__()
+        self.speed = DEFAULT_SPEED
 
-        self.image = self.original_image.copy()
+        # Sprite base compartilhado (carregado do disco só no primeiro Player);
+        # nunca é alterado: as versões inclinadas são renderizadas uma vez por faixa
+        # de yaw/pitch e reaproveitadas de _tilt_cache
+        self.original_image = _get_player_surface()
+
+        self.image = self.original_image
         self.rect = self.image.get_rect(center=pos)
         self.pos = pygame.math.Vector2(self.rect.topleft)
         self.screen_rect = pygame.Rect(0, 0, 480, 800)
 
-        # Hitbox reduzida
+        # Hitbox reduzida (um Rect só, redimensionado quando o rect do sprite muda de tamanho)
+        self.hitbox_rect = pygame.Rect(0, 0, 0, 0)
+        self._hitbox_src_size = None
         self._update_hitbox()
 
-        # Disparo cooldown
+        # Disparo cooldown (ms, comparado com pygame.time.get_ticks())
         self.shoot_cooldown = DEFAULT_SHOOT_COOLDOWN
-        self._last_shot_time = -999.0
+        self._last_shot_time = -10_000
+
+        # Direção pedida pelo teclado (ver apply_input); já normalizada na diagonal
+        self.move_dx = 0.0
+        self.move_dy = 0.0
 
         # Estados visuais (yaw/pitch)
         self.yaw_value = 0.0
         self.target_yaw_value = 0.0
         self.pitch_value = 0.0
         self.target_pitch_value = 0.0
+        # faixa (yaw, pitch) da imagem atual; None força a primeira troca
+        self._tilt_key = None
 
-    def _make_placeholder(self):
+    @staticmethod
+    def _make_placeholder():
         surf = pygame.Surface(SPRITE_DRAW_SIZE, pygame.SRCALPHA)
         w,h = SPRITE_DRAW_SIZE
+        # trava uma vez para as duas primitivas (sem lock/unlock interno em cada draw)
+        surf.lock()
         pygame.draw.polygon(surf, (200,160,80), [(w//2,0),(w-6,h//2),(w//2,h-2),(6,h//2)])
         pygame.draw.rect(surf, (100,60,20), (w//2-8,h//2,16,10))
-        return surf
+        surf.unlock()
+        return surf.convert_alpha()
 
     def _update_hitbox(self):
-        """Atualiza o retângulo de colisão reduzido (hitbox)."""
-        w, h = self.rect.size
-        reduced_w = int(w * HITBOX_SCALE)
-        reduced_h = int(h * HITBOX_SCALE)
-        cx, cy = self.rect.center
-        self.hitbox_rect = pygame.Rect(0, 0, reduced_w, reduced_h)
-        self.hitbox_rect.center = (cx, cy)
+        """Atualiza o retângulo de colisão reduzido (hitbox), reaproveitando o mesmo Rect."""
+        rect = self.rect
+        size = rect.size
+        if size != self._hitbox_src_size:
+            # o tamanho do rect só muda quando troca a faixa de inclinação
+            self._hitbox_src_size = size
+            self.hitbox_rect.size = (int(size[0] * HITBOX_SCALE), int(size[1] * HITBOX_SCALE))
+        self.hitbox_rect.center = rect.center
 
     def get_hitbox(self):
         """Retorna o retângulo de colisão reduzido."""
         return self.hitbox_rect
 
+    def apply_input(self, keys):
+        """Lê a direção de movimento do estado do teclado (pygame.key.get_pressed() do frame)."""
+        # máscara de 4 bits das direções -> (dx, dy) da tabela, diagonal já normalizada
+        # (direções opostas apertadas juntas se anulam)
+        self.move_dx, self.move_dy = _DIR_LUT[
+            (keys[_K_LEFT] or keys[_K_A])
+            | (keys[_K_RIGHT] or keys[_K_D]) << 1
+            | (keys[_K_UP] or keys[_K_W]) << 2
+            | (keys[_K_DOWN] or keys[_K_S]) << 3
+        ]
+
     def update(self, dt):
         """Movimento + animação + hitbox update."""
-        keys = pygame.key.get_pressed()
-        dx = dy = 0
-        if keys[pygame.K_LEFT] or keys[pygame.K_a]:
-            dx = -1
-        if keys[pygame.K_RIGHT] or keys[pygame.K_d]:
-            dx = 1
-        if keys[pygame.K_UP] or keys[pygame.K_w]:
-            dy = -1
-        if keys[pygame.K_DOWN] or keys[pygame.K_s]:
-            dy = 1
-
-        # Normaliza diagonal
-        if dx != 0 and dy != 0:
-            inv = math.sqrt(0.5)
-            dx *= inv
-            dy *= inv
-
-        self.pos.x += dx * self.speed * dt
-        self.pos.y += dy * self.speed * dt
-
-        tmp_rect = self.rect.copy()
-        tmp_rect.x = int(self.pos.x)
-        tmp_rect.y = int(self.pos.y)
-        tmp_rect.clamp_ip(self.screen_rect)
-        self.pos.x = tmp_rect.x
-        self.pos.y = tmp_rect.y
-        self.rect.x = int(self.pos.x)
-        self.rect.y = int(self.pos.y)
+        dx = self.move_dx
+        dy = self.move_dy
+
+        pos = self.pos
+        step = self.speed * dt
+
+        # prende na tela direto nos números (mesmo resultado do clamp_ip, sem copiar o rect)
+        rect = self.rect
+        sr = self.screen_rect
+        x = min(max(int(pos.x + dx * step), sr.left), sr.right - rect.width)
+        y = min(max(int(pos.y + dy * step), sr.top), sr.bottom - rect.height)
+        pos.x = x
+        pos.y = y
+        rect.x = x
+        rect.y = y
 
         # --- controle visual ---
         self.target_yaw_value = float(max(-1.0, min(1.0, dx)))
@@ -127,61 +215,41 @@ class Player(pygame.sprite.Sprite):
         self._update_hitbox()
 
     def _update_transformed_image(self):
-        """Aplica compressão horizontal + rotação para simular virada."""
-        yaw = self.yaw_value
-        abs_yaw = abs(yaw)
-        horiz_scale = 1.0 - (1.0 - MAX_HORIZ_SCALE) * abs_yaw
-        yaw_rot = -yaw * MAX_YAW_ROT_DEG
-        pitch_rot = self.pitch_value * PITCH_UP_ROT_DEG
-        total_rot = yaw_rot + pitch_rot
-
-        w0,h0 = SPRITE_DRAW_SIZE
-        new_w = max(2, int(w0 * horiz_scale))
-        scaled = pygame.transform.smoothscale(self.original_image, (new_w, h0))
-        canvas = pygame.Surface((w0, h0), pygame.SRCALPHA)
-        x_offset = (w0 - new_w) // 2
-        canvas.blit(scaled, (x_offset, 0))
-        rotated = pygame.transform.rotozoom(canvas, total_rot, 1.0)
-
-        old_center = self.rect.center
+        """Troca a imagem pela versão inclinada da tabela (yaw/pitch quantizados)."""
+        yi = round(self.yaw_value * TILT_YAW_BINS)
+        pi = round(self.pitch_value * TILT_PITCH_BINS)
+        key = (yi + TILT_YAW_BINS) * (TILT_PITCH_BINS + 1) + pi
+        if key == self._tilt_key:
+            # mesma faixa do frame anterior (voo reto/parado): imagem e tamanho do rect não mudam
+            return
+        self._tilt_key = key
+        rotated = _tilt_cache[key]
+        if rotated is None:
+            rotated = _render_tilt(yi / TILT_YAW_BINS, pi / TILT_PITCH_BINS)
+            _tilt_cache[key] = rotated
+
         self.image = rotated
-        self.rect = self.image.get_rect()
-        self.rect.center = old_center
+        self.rect = rotated.get_rect(center=self.rect.center)
 
     def shoot(self, target_pos=None):
         """Atira em direção ao cursor (mantido igual)."""
-        now = time.perf_counter()
+        now = pygame.time.get_ticks()
         if now - self._last_shot_time < self.shoot_cooldown:
             return None
         self._last_shot_time = now
 
-        try:
-            from src.bullet import Bullet
-        except Exception as e:
-            print(f"Aviso: não foi possível importar Bullet: {e}")
-            return None
-
-        sx, sy = self.rect.centerx, self.rect.top - 8
+        rect = self.rect
+        sx, sy = rect.centerx, rect.top - 8
         if target_pos is None:
-            try:
-                target_pos = pygame.mouse.get_pos()
-            except Exception:
-                target_pos = None
+            target_pos = pygame.mouse.get_pos()
 
-        if target_pos is None:
-            try:
-                return Bullet(pos=(sx, sy), vx=0.0, vy=-DEFAULT_BULLET_SPEED, owner="player")
-            except Exception:
-                return None
-
-        tx, ty = target_pos
-        dx = tx - sx
-        dy = ty - sy
-        dist = math.hypot(dx, dy) or 1.0
-        vx = dx / dist * DEFAULT_BULLET_SPEED
-        vy = dy / dist * DEFAULT_BULLET_SPEED
-
-        try:
-            return Bullet(pos=(sx, sy), vx=vx, vy=vy, owner="player")
-        except Exception:
-            return None
+        v = _Vec2(target_pos[0] - sx, target_pos[1] - sy)
+        if v.length_squared() == 0:
+            # mira exatamente no ponto de saída: atira reto para cima
+            vx, vy = 0.0, -DEFAULT_BULLET_SPEED
+        else:
+            v.scale_to_length(DEFAULT_BULLET_SPEED)
+            vx, vy = v.x, v.y
+
+        # falhas aqui sobem para Game._attempt_player_shoot, que já protege a chamada
+        return Bullet.acquire(pos=(sx, sy), vx=vx, vy=vy, owner="player")
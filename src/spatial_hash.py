@@ -0,0 +1,85 @@
+# src/spatial_hash.py
+# Grade uniforme (spatial hash) para a fase "larga" das colisões.
+# Cada sprite é registrado em todas as células que o seu rect cobre; uma consulta
+# devolve só os sprites das células tocadas pelo rect consultado, em vez do grupo inteiro.
+
+CELL_SIZE = 64
+
+
+class SpatialHash:
+    """
+    Dicionário célula (cx, cy) -> sprites registrados nela.
+    sync() mantém a grade entre frames: só mexe nos sprites que mudaram de conjunto de células.
+    """
+    def __init__(self, cell_size=CELL_SIZE):
+        self.cell_size = cell_size
+        # (cx, cy) -> dict usado como conjunto ordenado de sprites (remoção O(1))
+        self.cells = {}
+        # sprite -> (x0, x1, y0, y1), faixa de células em que ele está registrado
+        self._bounds = {}
+
+    def _cell_bounds(self, rect):
+        cs = self.cell_size
+        return (rect.left // cs, rect.right // cs, rect.top // cs, rect.bottom // cs)
+
+    def _add(self, sprite, bounds):
+        cells = self.cells
+        x0, x1, y0, y1 = bounds
+        for cx in range(x0, x1 + 1):
+            for cy in range(y0, y1 + 1):
+                bucket = cells.get((cx, cy))
+                if bucket is None:
+                    cells[(cx, cy)] = {sprite: None}
+                else:
+                    bucket[sprite] = None
+
+    def _remove(self, sprite, bounds):
+        cells = self.cells
+        x0, x1, y0, y1 = bounds
+        for cx in range(x0, x1 + 1):
+            for cy in range(y0, y1 + 1):
+                bucket = cells[(cx, cy)]
+                del bucket[sprite]
+                if not bucket:
+                    # célula vazia sai do dicionário (cells vazio == nenhum sprite registrado)
+                    del cells[(cx, cy)]
+
+    def insert(self, sprite):
+        bounds = self._cell_bounds(sprite.rect)
+        old = self._bounds.get(sprite)
+        if old == bounds:
+            return
+        if old is not None:
+            self._remove(sprite, old)
+        self._add(sprite, bounds)
+        self._bounds[sprite] = bounds
+
+    def remove(self, sprite):
+        old = self._bounds.pop(sprite, None)
+        if old is not None:
+            self._remove(sprite, old)
+
+    def sync(self, group):
+        """
+        Atualiza a grade para refletir group (um pygame.sprite.Group): reinsere só quem mudou
+        de células e remove quem saiu do grupo desde a última chamada.
+        """
+        insert = self.insert
+        for s in group:
+            insert(s)
+        bounds = self._bounds
+        if len(bounds) > len(group):
+            for s in [s for s in bounds if s not in group]:
+                self.remove(s)
+
+    def query(self, rect):
+        """Sprites candidatos a colidir com rect (sem repetição, em ordem de inserção)."""
+        cells = self.cells
+        found = {}
+        x0, x1, y0, y1 = self._cell_bounds(rect)
+        for cx in range(x0, x1 + 1):
+            for cy in range(y0, y1 + 1):
+                bucket = cells.get((cx, cy))
+                if bucket:
+                    found.update(bucket)
+        return list(found)
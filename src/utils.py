@@ -0,0 +1,64 @@
+# src/utils.py
+# Utilitários compartilhados pelos sprites do jogo.
+#
+import inspect
+
+import pygame
+
+
+class PooledSprite(pygame.sprite.Sprite):
+    """
+    Sprite reciclável: kill() devolve a instância a uma lista livre da própria classe
+    e acquire() reaproveita uma instância morta em vez de construir outra.
+
+    Contrato: toda subclasse define reset(...), que deixa a instância pronta para voltar ao
+    jogo; o __init__ da subclasse termina chamando self.reset(...), então uma subclasse sem
+    reset já falha na primeira construção.
+
+    acquire() e prefill() aceitam só os argumentos de reset: parâmetros que existem apenas no
+    __init__ (hp, speed, imagem...) ficam sempre no valor padrão das instâncias do pool, senão
+    uma instância reciclada herdaria os da sua primeira construção. Argumento fora de reset
+    levanta TypeError já na primeira chamada, e não só quando o pool começa a reciclar.
+    Quem precisa de valores próprios no __init__ constrói direto e desliga o pool (pool_limit = 0).
+    """
+    # máximo de instâncias mortas guardadas por classe (0 desliga o pool)
+    pool_limit = 64
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._free = []
+        reset = getattr(cls, "reset", None)
+        cls._reset_signature = inspect.signature(reset) if reset is not None else None
+
+    @classmethod
+    def _check_reset_args(cls, args, kwargs):
+        # o caminho do pool chama reset(*args): o de construção precisa aceitar exatamente o mesmo
+        if cls._reset_signature is not None:
+            cls._reset_signature.bind(None, *args, **kwargs)
+
+    @classmethod
+    def acquire(cls, *args, **kwargs):
+        if cls._free:
+            obj = cls._free.pop()
+            obj.reset(*args, **kwargs)
+            return obj
+        cls._check_reset_args(args, kwargs)
+        return cls(*args, **kwargs)
+
+    @classmethod
+    def prefill(cls, count, *args, **kwargs):
+        """Constrói até count instâncias de antemão e as deixa no pool (respeita pool_limit)."""
+        if args or kwargs:
+            # sem argumentos valem os padrões do __init__; com argumentos, as mesmas regras de acquire
+            cls._check_reset_args(args, kwargs)
+        free = cls._free
+        for _ in range(min(count, cls.pool_limit) - len(free)):
+            free.append(cls(*args, **kwargs))
+
+    def kill(self):
+        # só recicla quem estava vivo (kill repetido não duplica a entrada no pool)
+        if self.alive():
+            super().kill()
+            free = type(self)._free
+            if len(free) < self.pool_limit:
+                free.append(self)